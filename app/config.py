@@ -11,9 +11,17 @@ class Settings(BaseSettings):
 
     mongodb_url: str = "mongodb://mongodb:27017"
     mongodb_db_name: str = "metadata_inventory"
+    mongo_max_pool_size: int = 200
+    mongo_min_pool_size: int = 10
+    mongo_max_idle_time_ms: int = 300_000
+    mongo_wait_queue_timeout_ms: int = 5000
     app_host: str = "0.0.0.0"
     app_port: int = 8000
     request_timeout: int = 15
+    max_page_bytes: int = 2_000_000
+    background_concurrency: int = 20
+    background_timeout: int = 120
+    log_level: str = "INFO"
 
     model_config = {
         "env_file": ".env",
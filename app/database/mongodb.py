@@ -1,26 +1,30 @@
 """
 MongoDB connection management and database operations.
 
-Uses Motor (async MongoDB driver) for non-blocking database access.
+Uses PyMongo's native asyncio client for non-blocking database access
+directly on the event loop (no thread-pool hop per query).
 Implements connection retry logic for resilience during startup.
 """
 
 import asyncio
 import logging
+import random
 
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 # Module-level references managed via lifespan
-_client: AsyncIOMotorClient | None = None
-_database: AsyncIOMotorDatabase | None = None
+_client: AsyncMongoClient | None = None
+_database: AsyncDatabase | None = None
 
 # Retry configuration for startup resilience
 _MAX_RETRIES = 5
-_RETRY_BASE_DELAY = 2  # seconds (exponential backoff: 2, 4, 8, 16, 32)
+_RETRY_BASE_DELAY = 2  # seconds (exponential backoff: 2, 4, 8, 16, capped at 30)
+_MAX_DELAY = 30  # seconds — upper bound on any single backoff wait
 
 
 async def connect_to_mongodb() -> None:
@@ -35,10 +39,14 @@ async def connect_to_mongodb() -> None:
 
     logger.info("Connecting to MongoDB at %s ...", settings.mongodb_url)
 
-    _client = AsyncIOMotorClient(
+    _client = AsyncMongoClient(
         settings.mongodb_url,
         serverSelectionTimeoutMS=5000,
         connectTimeoutMS=5000,
+        maxPoolSize=settings.mongo_max_pool_size,
+        minPoolSize=settings.mongo_min_pool_size,
+        maxIdleTimeMS=settings.mongo_max_idle_time_ms,
+        waitQueueTimeoutMS=settings.mongo_wait_queue_timeout_ms,
     )
 
     _database = _client[settings.mongodb_db_name]
@@ -53,9 +61,14 @@ async def connect_to_mongodb() -> None:
             if attempt == _MAX_RETRIES:
                 logger.error("Failed to connect to MongoDB after %d attempts.", _MAX_RETRIES)
                 raise
-            delay = _RETRY_BASE_DELAY ** attempt
+            # base * 2^attempt with a cap, plus up to 50% jitter so
+            # replicas started together don't retry in lock-step
+            delay = min(
+                _MAX_DELAY,
+                _RETRY_BASE_DELAY * (2 ** (attempt - 1)) * (1 + random.uniform(0, 0.5)),
+            )
             logger.warning(
-                "MongoDB not ready (attempt %d/%d): %s — retrying in %ds …",
+                "MongoDB not ready (attempt %d/%d): %s — retrying in %.1fs …",
                 attempt,
                 _MAX_RETRIES,
                 exc,
@@ -65,21 +78,35 @@ async def connect_to_mongodb() -> None:
 
     # Create a unique index on 'url' for fast lookups and deduplication
     await _database.metadata.create_index("url", unique=True)
+    # Compound index supporting recency queries (e.g. latest records,
+    # per-URL history ordered by update time) without a collection scan
+    await _database.metadata.create_index([("url", 1), ("updated_at", -1)])
     logger.info("Database indexes ensured.")
 
+    # Prewarm the pool with parallel no-op queries so the baseline
+    # sockets exist before the app advertises readiness — the first
+    # burst of concurrent requests then never waits on a handshake
+    await asyncio.gather(
+        *(
+            _database.metadata.find_one({"url": "__warmup__"})
+            for _ in range(settings.mongo_min_pool_size)
+        )
+    )
+    logger.info("Connection pool prewarmed (%d connections).", settings.mongo_min_pool_size)
+
 
 async def close_mongodb_connection() -> None:
     """Gracefully close the MongoDB connection."""
     global _client, _database
 
     if _client is not None:
-        _client.close()
+        await _client.close()
         _client = None
         _database = None
         logger.info("MongoDB connection closed.")
 
 
-def get_database() -> AsyncIOMotorDatabase:
+def get_database() -> AsyncDatabase:
     """
     Return the active database instance.
 
@@ -4,11 +4,19 @@ Metadata repository — data-access layer.
 Encapsulates all direct MongoDB operations for the metadata collection.
 This abstraction makes it straightforward to swap the storage backend
 (e.g., PostgreSQL, Redis) without touching business logic or routes.
+
+Indexes (created at startup in ``connect_to_mongodb``):
+    - ``url`` (unique): equality lookups and upsert deduplication.
+    - ``(url, updated_at desc)``: recency-ordered queries so they never
+      fall back to a collection scan.
 """
 
 import logging
 from datetime import datetime
 
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
 from app.database.mongodb import get_database
 from app.models.metadata import MetadataDocument
 
@@ -22,6 +30,10 @@ async def upsert_metadata(doc: MetadataDocument, now: datetime) -> None:
     On insert, ``created_at`` is set to *now*. On subsequent updates
     only the remaining fields are overwritten.
 
+    Tries a plain insert first — the common case for new URLs — and only
+    falls back to an update when the unique index on ``url`` reports a
+    collision, avoiding the find-or-insert probe of ``upsert=True``.
+
     Args:
         doc: The metadata document to persist.
         now: The current UTC timestamp.
@@ -31,32 +43,72 @@ async def upsert_metadata(doc: MetadataDocument, now: datetime) -> None:
     update_data = doc.to_mongo_dict()
     update_data.pop("created_at", None)
 
-    await db.metadata.update_one(
-        {"url": doc.url},
-        {
-            "$set": update_data,
-            "$setOnInsert": {"created_at": now},
-        },
-        upsert=True,
-    )
+    try:
+        await db.metadata.insert_one({**update_data, "created_at": now})
+    except DuplicateKeyError:
+        await db.metadata.update_one({"url": doc.url}, {"$set": update_data})
+
+    logger.debug("Metadata record upserted for %s", doc.url)
+
+
+async def batch_upsert_metadata(docs: list[MetadataDocument], now: datetime) -> None:
+    """
+    Upsert several metadata documents in a single bulk_write round trip.
+
+    Used by the write batcher to coalesce writes that arrive within a
+    short window — N individual update commands collapse into one.
 
-    logger.info("Metadata record upserted for %s", doc.url)
+    Args:
+        docs: The metadata documents to persist.
+        now: The current UTC timestamp, used for ``created_at`` on inserts.
+    """
+    db = get_database()
+
+    ops = []
+    for doc in docs:
+        update_data = doc.to_mongo_dict()
+        update_data.pop("created_at", None)
+        ops.append(
+            UpdateOne(
+                {"url": doc.url},
+                {
+                    "$set": update_data,
+                    "$setOnInsert": {"created_at": now},
+                },
+                upsert=True,
+            )
+        )
 
+    await db.metadata.bulk_write(ops, ordered=False)
 
-async def find_metadata_by_url(url: str) -> MetadataDocument | None:
+    logger.debug("Bulk upserted %d metadata records.", len(ops))
+
+
+async def find_metadata_by_url(url: str, fields: set[str] | None = None) -> MetadataDocument | None:
     """
     Look up a metadata document by URL.
 
     Args:
         url: The fully-qualified URL to search for.
+        fields: Optional subset of fields to fetch. When given, only these
+            fields (plus the identifying/timestamp fields) are transferred
+            from MongoDB — skipping e.g. a large ``page_source`` entirely.
 
     Returns:
-        A MetadataDocument if found, otherwise None.
+        A MetadataDocument if found, otherwise None. Fields excluded by
+        the projection fall back to their model defaults.
     """
     db = get_database()
-    doc = await db.metadata.find_one({"url": url}, {"_id": 0})
+
+    projection: dict = {"_id": 0}
+    if fields is not None:
+        projection |= {f: 1 for f in fields}
+        # Always needed to build a valid document / response
+        projection |= {"url": 1, "created_at": 1, "updated_at": 1}
+
+    doc = await db.metadata.find_one({"url": url}, projection)
 
     if doc is None:
         return None
 
-    return MetadataDocument(**doc)
+    return MetadataDocument.from_mongo_dict(doc)
@@ -10,17 +10,19 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
+from app.config import settings
 from app.database.mongodb import close_mongodb_connection, connect_to_mongodb
+from app.responses import ORJSONResponse
 from app.routes.metadata import router as metadata_router
 from app.services.collector import close_http_client, create_http_client
+from app.services.metadata_service import start_write_batcher, stop_write_batcher
 
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
 logging.basicConfig(
-    level=logging.INFO,
+    level=settings.log_level,
     format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
 )
 logger = logging.getLogger(__name__)
@@ -37,12 +39,14 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up …")
     create_http_client()
     await connect_to_mongodb()
+    start_write_batcher()
     logger.info("Application is ready.")
 
     yield
 
     # Shutdown
     logger.info("Shutting down …")
+    await stop_write_batcher()
     await close_http_client()
     await close_mongodb_connection()
     logger.info("Shutdown complete.")
@@ -60,6 +64,7 @@ app = FastAPI(
     ),
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS — allow all origins for local development
@@ -79,10 +84,10 @@ app.include_router(metadata_router, prefix="/api/v1")
 # ---------------------------------------------------------------------------
 
 @app.exception_handler(Exception)
-async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def unhandled_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Catch-all handler so unhandled errors return structured JSON."""
     logger.exception("Unhandled error on %s %s", request.method, request.url.path)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "An internal server error occurred. Please try again later."},
     )
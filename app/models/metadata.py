@@ -5,8 +5,17 @@ and internal data representation of URL metadata records.
 
 from datetime import datetime, timezone
 
+import zstandard
 from pydantic import BaseModel, Field, HttpUrl
 
+# Shared (de)compressors for page_source — HTML is 70-90% compressible,
+# so compressing before the Mongo round trip cuts wire and disk bytes
+_zstd_compressor = zstandard.ZstdCompressor(level=3)
+_zstd_decompressor = zstandard.ZstdDecompressor()
+
+# Resolved once — avoids repeated attribute lookups in default factories
+_UTC = timezone.utc
+
 
 # ---------------------------------------------------------------------------
 # Request models
@@ -89,10 +98,38 @@ class MetadataDocument(BaseModel):
     headers: dict = Field(default_factory=dict)
     cookies: dict = Field(default_factory=dict)
     page_source: str = ""
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(_UTC))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(_UTC))
 
     def to_mongo_dict(self) -> dict:
-        """Convert the model to a dictionary suitable for MongoDB insertion."""
+        """
+        Convert the model to a dictionary suitable for MongoDB insertion.
+
+        ``page_source`` is zstd-compressed and stored as BSON binary so
+        large HTML bodies don't dominate wire and disk I/O.
+        """
         data = self.model_dump()
+        if self.page_source:
+            data["page_source"] = {
+                "compressed": True,
+                "data": _zstd_compressor.compress(self.page_source.encode()),
+            }
         return data
+
+    @classmethod
+    def from_mongo_dict(cls, doc: dict) -> "MetadataDocument":
+        """
+        Build a model from a MongoDB document, transparently decompressing
+        ``page_source`` when it was stored in the compressed form.
+        Plain-string documents written before compression still load.
+
+        Uses ``model_construct`` — the document was validated when it was
+        written, so re-running field validation on every read is redundant.
+        (A module-level ``TypeAdapter(MetadataDocument)`` would cache the
+        compiled validator, but still validates; ``model_construct`` skips
+        that work entirely, so it is the preferred read path.)
+        """
+        page_source = doc.get("page_source")
+        if isinstance(page_source, dict) and page_source.get("compressed"):
+            doc["page_source"] = _zstd_decompressor.decompress(page_source["data"]).decode()
+        return cls.model_construct(**doc)
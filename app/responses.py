@@ -0,0 +1,21 @@
+"""
+Custom response classes for the API.
+
+orjson serializes payloads dominated by large strings (page_source)
+several times faster than the stdlib ``json`` encoder and writes UTF-8
+bytes directly, skipping Python-level string escaping.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_UTC_Z)
@@ -9,8 +9,8 @@ Endpoints:
 import logging
 
 import httpx
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import HttpUrl, TypeAdapter, ValidationError
 
 from app.models.metadata import (
     AcceptedResponse,
@@ -19,6 +19,7 @@ from app.models.metadata import (
     MetadataResponse,
     URLRequest,
 )
+from app.responses import ORJSONResponse
 from app.services.metadata_service import (
     create_metadata_record,
     get_metadata_record,
@@ -29,6 +30,35 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/metadata", tags=["Metadata"])
 
+# Fields the GET endpoint allows clients to select via ?include=
+_INCLUDABLE_FIELDS = {"headers", "cookies", "page_source"}
+
+# Built once — validates the GET query param with full URL parsing
+_http_url_adapter: TypeAdapter = TypeAdapter(HttpUrl)
+
+
+def validate_http_url(
+    url: str = Query(
+        ...,
+        description="The fully-qualified URL to look up.",
+        examples=["https://example.com"],
+    ),
+) -> str:
+    """
+    Validate the ``url`` query parameter as a proper HTTP(S) URL.
+
+    Rejecting malformed URLs here avoids wasting a Mongo lookup and a
+    background collection attempt on input that can never resolve.
+    """
+    try:
+        _http_url_adapter.validate_python(url)
+    except ValidationError:
+        raise HTTPException(
+            status_code=400,
+            detail="URL must be a valid http:// or https:// URL.",
+        )
+    return url
+
 
 # ---------------------------------------------------------------------------
 # POST /metadata
@@ -79,6 +109,7 @@ async def post_metadata(body: URLRequest) -> CreatedResponse:
     response_model=MetadataResponse,
     responses={
         202: {"model": AcceptedResponse, "description": "Metadata is being collected."},
+        304: {"description": "Record unchanged since the supplied ETag."},
         400: {"model": ErrorResponse, "description": "Invalid URL supplied."},
     },
     summary="Retrieve metadata for a URL",
@@ -89,27 +120,49 @@ async def post_metadata(body: URLRequest) -> CreatedResponse:
     ),
 )
 async def get_metadata(
-    url: str = Query(
-        ...,
-        description="The fully-qualified URL to look up.",
-        examples=["https://example.com"],
+    request: Request,
+    response: Response,
+    url: str = Depends(validate_http_url),
+    include: str | None = Query(
+        None,
+        description=(
+            "Optional comma-separated subset of fields to return "
+            "(headers, cookies, page_source). Omitting this returns everything."
+        ),
+        examples=["headers,cookies"],
     ),
-) -> MetadataResponse | JSONResponse:
+) -> MetadataResponse | Response:
     """Retrieve metadata for the requested URL."""
-    # Basic URL validation
-    if not url.startswith(("http://", "https://")):
-        raise HTTPException(status_code=400, detail="URL must start with http:// or https://")
-
-    record = await get_metadata_record(url)
+    fields: set[str] | None = None
+    if include:
+        fields = {part.strip() for part in include.split(",") if part.strip()}
+        unknown = fields - _INCLUDABLE_FIELDS
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown include field(s): {', '.join(sorted(unknown))}",
+            )
+
+    record = await get_metadata_record(url, fields=fields)
 
     if record is not None:
-        # Cache hit — return the full dataset
-        return MetadataResponse(**record.model_dump())
+        # updated_at is a natural ETag — polling clients that already
+        # hold the current version skip the full page_source transfer
+        etag = f'W/"{int(record.updated_at.timestamp())}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        response.headers["ETag"] = etag
+
+        # Cache hit — return the full dataset. model_construct reuses the
+        # already-validated field values instead of dumping the document
+        # to a dict and re-validating every field (including a potentially
+        # large page_source) a second time.
+        return MetadataResponse.model_construct(**record.__dict__)
 
     # Cache miss — schedule background collection and respond immediately
     schedule_background_collection(url)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=202,
         content=AcceptedResponse(url=url).model_dump(),
     )
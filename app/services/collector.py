@@ -19,6 +19,9 @@ logger = logging.getLogger(__name__)
 # Shared HTTP client — initialised/closed via app lifespan
 _http_client: httpx.AsyncClient | None = None
 
+# Read size for streaming response bodies
+_CHUNK_SIZE = 65_536
+
 
 def create_http_client() -> None:
     """Create the shared httpx client (called at app startup)."""
@@ -26,7 +29,15 @@ def create_http_client() -> None:
     _http_client = httpx.AsyncClient(
         timeout=settings.request_timeout,
         follow_redirects=True,
-        limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+        # HTTP/2 multiplexes many collections over one TCP+TLS connection
+        # to the same host; the keepalive pool is sized to cover the
+        # background-collection concurrency without churning connections.
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=200,
+            max_keepalive_connections=50,
+            keepalive_expiry=30.0,
+        ),
     )
     logger.info("Shared HTTP client created.")
 
@@ -64,17 +75,39 @@ async def collect_metadata(url: str) -> dict:
         httpx.HTTPStatusError: If the response indicates an HTTP error.
         httpx.RequestError: If a network / connection error occurs.
     """
-    logger.info("Collecting metadata for URL: %s", url)
+    logger.debug("Collecting metadata for URL: %s", url)
 
     client = _get_client()
-    response = await client.get(url)
-    response.raise_for_status()
-
-    headers = dict(response.headers)
-    cookies = dict(response.cookies)
-    page_source = response.text
-
-    logger.info(
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+
+        # Iterate the raw header/cookie pairs directly instead of rebuilding
+        # them through dict(...) on httpx's multidict wrappers — one decode,
+        # no intermediate copies on the hot collection path.
+        headers = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in response.headers.raw
+        }
+        cookies = {cookie.name: cookie.value for cookie in response.cookies.jar}
+
+        # Stream the body in chunks, capping at max_page_bytes so one
+        # oversized page can't pin unbounded memory or exceed MongoDB's
+        # 16 MB document limit.
+        body = bytearray()
+        async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+            body += chunk
+            if len(body) >= settings.max_page_bytes:
+                del body[settings.max_page_bytes:]
+                logger.warning(
+                    "Page source for %s truncated at %d bytes.",
+                    url,
+                    settings.max_page_bytes,
+                )
+                break
+
+        page_source = bytes(body).decode(response.encoding or "utf-8", errors="replace")
+
+    logger.debug(
         "Metadata collected for %s — headers: %d, cookies: %d, page_source length: %d",
         url,
         len(headers),
@@ -12,14 +12,144 @@ import asyncio
 import logging
 from datetime import datetime, timezone
 
-from app.database.repository import find_metadata_by_url, upsert_metadata
+from cachetools import TTLCache
+
+from app.config import settings
+from app.database.repository import (
+    batch_upsert_metadata,
+    find_metadata_by_url,
+    upsert_metadata,
+)
 from app.models.metadata import MetadataDocument
 from app.services.collector import collect_metadata
 
 logger = logging.getLogger(__name__)
 
-# In-flight tracker — prevents duplicate background tasks for the same URL
-_pending_urls: set[str] = set()
+# Resolved once — avoids a module attribute lookup per timestamp
+_UTC = timezone.utc
+
+# In-flight tracker — prevents duplicate background tasks for the same URL.
+# Entries expire after background_timeout seconds so a crashed or cancelled
+# task can never leave a URL permanently marked as pending.
+_pending_urls: TTLCache = TTLCache(maxsize=100_000, ttl=settings.background_timeout)
+
+# Caps concurrent background collections so a burst of cache-miss GETs
+# can't exhaust the httpx or MongoDB connection pools
+_collect_semaphore = asyncio.Semaphore(settings.background_concurrency)
+
+# Read-through cache for GET lookups — serves hot URLs without a Mongo
+# round trip. Entries expire after a short TTL and are invalidated on write.
+_record_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_cache_lock = asyncio.Lock()
+
+# Write batcher — coalesces upserts arriving within a short window into
+# a single bulk_write round trip. Started/stopped via app lifespan;
+# when not running, writes fall back to individual upserts.
+_BATCH_MAX_OPS = 32
+_BATCH_WINDOW_SECONDS = 0.1
+_write_queue: asyncio.Queue | None = None
+_writer_task: asyncio.Task | None = None
+
+# Queued behind all pending writes at shutdown — tells the loop to flush
+# what it has and exit, so no batch is ever cancelled mid-write
+_STOP = object()
+
+
+def start_write_batcher() -> None:
+    """Start the background writer task (called at app startup)."""
+    global _write_queue, _writer_task
+    _write_queue = asyncio.Queue()
+    _writer_task = asyncio.create_task(_write_batcher_loop(_write_queue))
+    logger.info("Write batcher started.")
+
+
+async def stop_write_batcher() -> None:
+    """Stop the background writer task (called at app shutdown)."""
+    global _write_queue, _writer_task
+
+    if _writer_task is None:
+        return
+
+    queue, task = _write_queue, _writer_task
+    # Route new writes straight to Mongo while we drain
+    _write_queue = None
+    _writer_task = None
+
+    # The queue is FIFO, so the sentinel lands behind every pending
+    # write — the loop flushes all of them, then exits on its own.
+    # Cancelling instead could land mid-bulk_write, dropping the batch
+    # and leaving its callers awaiting futures that never resolve.
+    await queue.put(_STOP)
+    await task
+    logger.info("Write batcher stopped.")
+
+
+async def _write_batcher_loop(queue: asyncio.Queue) -> None:
+    """
+    Collect queued (document, future) pairs into batches of up to
+    ``_BATCH_MAX_OPS`` within a ``_BATCH_WINDOW_SECONDS`` window, then
+    flush each batch with one bulk_write. Futures are resolved (or
+    failed) once their batch has been written. Exits after flushing
+    everything queued ahead of the ``_STOP`` sentinel.
+    """
+    loop = asyncio.get_running_loop()
+
+    while True:
+        item = await queue.get()
+        if item is _STOP:
+            return
+
+        batch = [item]
+        stopping = False
+        deadline = loop.time() + _BATCH_WINDOW_SECONDS
+
+        while len(batch) < _BATCH_MAX_OPS:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if item is _STOP:
+                stopping = True
+                break
+            batch.append(item)
+
+        now = datetime.now(_UTC)
+        try:
+            await batch_upsert_metadata([doc for doc, _ in batch], now)
+        except asyncio.CancelledError:
+            # Defensive: if the task is ever cancelled mid-flush, fail the
+            # batch's futures so no caller is left awaiting one forever
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(
+                        RuntimeError("Write batcher stopped before the batch was written.")
+                    )
+            raise
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+        if stopping:
+            return
+
+
+async def _enqueue_upsert(doc: MetadataDocument, now: datetime) -> None:
+    """Hand a write to the batcher, or write directly if it isn't running."""
+    if _write_queue is None:
+        await upsert_metadata(doc, now)
+        return
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    await _write_queue.put((doc, future))
+    await future
 
 
 async def create_metadata_record(url: str) -> MetadataDocument:
@@ -37,7 +167,7 @@ async def create_metadata_record(url: str) -> MetadataDocument:
     """
     raw = await collect_metadata(url)
 
-    now = datetime.now(timezone.utc)
+    now = datetime.now(_UTC)
 
     doc = MetadataDocument(
         url=url,
@@ -48,36 +178,64 @@ async def create_metadata_record(url: str) -> MetadataDocument:
         updated_at=now,
     )
 
-    await upsert_metadata(doc, now)
+    await _enqueue_upsert(doc, now)
+
+    # Invalidate any cached copy so the next GET sees the fresh record
+    async with _cache_lock:
+        _record_cache.pop(url, None)
+
     return doc
 
 
-async def get_metadata_record(url: str) -> MetadataDocument | None:
+async def get_metadata_record(url: str, fields: set[str] | None = None) -> MetadataDocument | None:
     """
-    Retrieve the metadata record for *url* from MongoDB.
+    Retrieve the metadata record for *url*, consulting the in-process
+    cache before falling back to MongoDB.
+
+    Args:
+        url: The fully-qualified URL to look up.
+        fields: Optional projection — when given, only these fields are
+            fetched from MongoDB and the read cache is bypassed so that
+            partial documents are never cached.
 
     Returns:
         A MetadataDocument if found, otherwise None.
     """
-    return await find_metadata_by_url(url)
+    if fields is not None:
+        return await find_metadata_by_url(url, fields)
+
+    async with _cache_lock:
+        cached = _record_cache.get(url)
+    if cached is not None:
+        return cached
+
+    record = await find_metadata_by_url(url)
+
+    if record is not None:
+        async with _cache_lock:
+            _record_cache[url] = record
+
+    return record
 
 
 async def _background_collect(url: str) -> None:
     """
     Internal background task that collects and stores metadata.
 
-    This runs independently of the request-response cycle.
-    On failure it logs the error and removes the URL from the
-    in-flight set so it can be retried on the next request.
+    This runs independently of the request-response cycle, gated by a
+    semaphore so at most ``settings.background_concurrency`` collections
+    run at once. On failure it logs the error and removes the URL from
+    the in-flight set so it can be retried on the next request.
     """
     try:
-        logger.info("Background collection started for %s", url)
-        await create_metadata_record(url)
-        logger.info("Background collection completed for %s", url)
+        async with _collect_semaphore:
+            logger.debug("Background collection started for %s", url)
+            await create_metadata_record(url)
+            logger.debug("Background collection completed for %s", url)
     except Exception:
         logger.exception("Background collection failed for %s", url)
     finally:
-        _pending_urls.discard(url)
+        _pending_urls.pop(url, None)
 
 
 def schedule_background_collection(url: str) -> bool:
@@ -94,10 +252,10 @@ def schedule_background_collection(url: str) -> bool:
         True if a new task was scheduled, False if one is already in-flight.
     """
     if url in _pending_urls:
-        logger.info("Background collection already in-flight for %s", url)
+        logger.debug("Background collection already in-flight for %s", url)
         return False
 
-    _pending_urls.add(url)
+    _pending_urls[url] = True
     asyncio.create_task(_background_collect(url))
-    logger.info("Background collection task scheduled for %s", url)
+    logger.debug("Background collection task scheduled for %s", url)
     return True
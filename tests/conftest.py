@@ -3,6 +3,11 @@ Shared pytest fixtures for the test suite.
 
 Uses mongomock-motor for an in-memory MongoDB so tests run without
 a real database, and asgi-lifespan to drive the FastAPI lifespan.
+
+The FastAPI ``app`` is imported once at module level (below), so route
+construction, Pydantic schema compilation, and the dependency graph are
+built a single time per session and shared by every test module through
+the session-scoped client — fixtures must never re-import or rebuild it.
 """
 
 from unittest.mock import AsyncMock, patch
@@ -11,16 +16,34 @@ import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
+from mongomock.collection import BulkOperationBuilder
+
 from app.database import mongodb as mongodb_module
 from app.services import collector as collector_module
 from app.main import app
 
+# mongomock's bulk builder predates the `sort` kwarg pymongo now passes
+# for update operations — accept and ignore it so bulk_write works.
+_original_add_update = BulkOperationBuilder.add_update
+
+
+def _add_update_compat(
+    self, selector, doc, multi=False, upsert=False,
+    collation=None, array_filters=None, hint=None, sort=None,
+):
+    return _original_add_update(
+        self, selector, doc, multi, upsert, collation, array_filters, hint,
+    )
+
 
-@pytest_asyncio.fixture()
-async def mock_db():
+BulkOperationBuilder.add_update = _add_update_compat
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def _module_mock_client():
     """
-    Provide a mongomock-motor database and patch the module-level
-    reference so the rest of the application uses it transparently.
+    Build the mongomock-motor client, database, and index once per
+    module — per-test isolation comes from the cheap reset below.
     """
     from mongomock_motor import AsyncMongoMockClient
 
@@ -30,12 +53,34 @@ async def mock_db():
     # Create the same index the real startup would create
     await db.metadata.create_index("url", unique=True)
 
+    yield client, db
+
+    client.close()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def mock_db(_module_mock_client):
+    """
+    Patch the module-level database reference so the application uses
+    the in-memory database transparently. Autouse so every test gets a
+    clean store (one delete_many, not a full client + index rebuild),
+    which in turn lets the ASGI client below be shared session-wide.
+    """
+    client, db = _module_mock_client
+    await db.metadata.delete_many({})
+
     with patch.object(mongodb_module, "_client", client), \
          patch.object(mongodb_module, "_database", db):
         yield db
 
-    # Clean up
-    client.close()
+
+@pytest_asyncio.fixture(autouse=True)
+def clear_record_cache():
+    """Empty the in-process read cache so tests stay isolated."""
+    from app.services import metadata_service
+
+    metadata_service._record_cache.clear()
+    yield
 
 
 @pytest_asyncio.fixture(autouse=True)
@@ -49,11 +94,15 @@ async def mock_http_client():
         yield mock_client
 
 
-@pytest_asyncio.fixture()
-async def async_client(mock_db) -> AsyncClient:
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client() -> AsyncClient:
     """
-    Async HTTP test client wired to the FastAPI app.
-    Lifespan is NOT triggered (we already patched the DB above).
+    Async HTTP test client wired to the FastAPI app, created once per
+    session. ASGITransport routes each request in-process as an awaited
+    call on the app — no loopback TCP, no syscalls — and holds no
+    sockets or loop state, so the same client can serve every test while
+    the autouse fixtures above keep database and cache state isolated.
+    Lifespan is NOT triggered (the DB is patched per test instead).
     """
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as client:
@@ -2,7 +2,7 @@
 Tests for the HTTP metadata collector service.
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
@@ -11,20 +11,48 @@ from app.services import collector as collector_module
 from app.services.collector import collect_metadata
 
 
-@pytest.mark.asyncio
-async def test_collect_metadata_success():
-    """Collector should return headers, cookies, and page_source."""
+def _mock_streaming_client(body: bytes, headers: dict, cookies: dict) -> AsyncMock:
+    """Build a mock client whose .stream() yields *body* in one chunk."""
     mock_response = AsyncMock()
-    mock_response.headers = {"content-type": "text/html", "server": "gunicorn"}
-    mock_response.cookies = httpx.Cookies({"sid": "abc"})
-    mock_response.text = "<html><body>Test</body></html>"
+    mock_response.headers = httpx.Headers(headers)
+    mock_response.cookies = httpx.Cookies(cookies)
+    mock_response.encoding = "utf-8"
     mock_response.raise_for_status = lambda: None
 
+    async def aiter_bytes(chunk_size):
+        yield body
+
+    mock_response.aiter_bytes = aiter_bytes
+
+    stream_cm = AsyncMock()
+    stream_cm.__aenter__.return_value = mock_response
+
     mock_client = AsyncMock()
-    mock_client.get.return_value = mock_response
+    mock_client.stream = MagicMock(return_value=stream_cm)
+    return mock_client
+
+
+def _mock_failing_client(exc: Exception) -> AsyncMock:
+    """Build a mock client whose .stream() fails on entering the context."""
+    stream_cm = AsyncMock()
+    stream_cm.__aenter__.side_effect = exc
+
+    mock_client = AsyncMock()
+    mock_client.stream = MagicMock(return_value=stream_cm)
+    return mock_client
+
 
-    with patch.object(collector_module, "_http_client", mock_client):
-        result = await collect_metadata("https://example.com")
+@pytest.mark.asyncio
+async def test_collect_metadata_success(monkeypatch):
+    """Collector should return headers, cookies, and page_source."""
+    mock_client = _mock_streaming_client(
+        body=b"<html><body>Test</body></html>",
+        headers={"content-type": "text/html", "server": "gunicorn"},
+        cookies={"sid": "abc"},
+    )
+
+    monkeypatch.setattr(collector_module, "_http_client", mock_client)
+    result = await collect_metadata("https://example.com")
 
     assert "headers" in result
     assert "cookies" in result
@@ -33,22 +61,36 @@ async def test_collect_metadata_success():
 
 
 @pytest.mark.asyncio
-async def test_collect_metadata_timeout():
+async def test_collect_metadata_caps_page_source(monkeypatch):
+    """Collector should truncate bodies larger than max_page_bytes."""
+    monkeypatch.setattr(collector_module.settings, "max_page_bytes", 10)
+    mock_client = _mock_streaming_client(
+        body=b"x" * 100,
+        headers={"content-type": "text/html"},
+        cookies={},
+    )
+
+    monkeypatch.setattr(collector_module, "_http_client", mock_client)
+    result = await collect_metadata("https://big.example.com")
+
+    assert result["page_source"] == "x" * 10
+
+
+@pytest.mark.asyncio
+async def test_collect_metadata_timeout(monkeypatch):
     """Collector should raise on timeout."""
-    mock_client = AsyncMock()
-    mock_client.get.side_effect = httpx.ReadTimeout("Timed out")
+    mock_client = _mock_failing_client(httpx.ReadTimeout("Timed out"))
 
-    with patch.object(collector_module, "_http_client", mock_client):
-        with pytest.raises(httpx.ReadTimeout):
-            await collect_metadata("https://slow.example.com")
+    monkeypatch.setattr(collector_module, "_http_client", mock_client)
+    with pytest.raises(httpx.ReadTimeout):
+        await collect_metadata("https://slow.example.com")
 
 
 @pytest.mark.asyncio
-async def test_collect_metadata_connection_error():
+async def test_collect_metadata_connection_error(monkeypatch):
     """Collector should raise on connection failure."""
-    mock_client = AsyncMock()
-    mock_client.get.side_effect = httpx.ConnectError("Connection refused")
+    mock_client = _mock_failing_client(httpx.ConnectError("Connection refused"))
 
-    with patch.object(collector_module, "_http_client", mock_client):
-        with pytest.raises(httpx.ConnectError):
-            await collect_metadata("https://down.example.com")
+    monkeypatch.setattr(collector_module, "_http_client", mock_client)
+    with pytest.raises(httpx.ConnectError):
+        await collect_metadata("https://down.example.com")
@@ -54,6 +54,101 @@ async def test_get_metadata_cache_miss(async_client):
     mock_schedule.assert_called_once_with("https://unknown.example.com")
 
 
+@pytest.mark.asyncio
+async def test_get_metadata_etag_304(async_client, mock_db):
+    """GET with a matching If-None-Match should return 304 with no body."""
+    now = datetime.now(timezone.utc)
+    await mock_db.metadata.insert_one({
+        "url": "https://etag.example.com",
+        "headers": {},
+        "cookies": {},
+        "page_source": "<html>unchanged</html>",
+        "created_at": now,
+        "updated_at": now,
+    })
+
+    first = await async_client.get(
+        "/api/v1/metadata",
+        params={"url": "https://etag.example.com"},
+    )
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    second = await async_client.get(
+        "/api/v1/metadata",
+        params={"url": "https://etag.example.com"},
+        headers={"If-None-Match": etag},
+    )
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_include_projection(async_client, mock_db):
+    """GET with ?include= should only fetch the requested fields."""
+    now = datetime.now(timezone.utc)
+    await mock_db.metadata.insert_one({
+        "url": "https://example.com",
+        "headers": {"server": "nginx"},
+        "cookies": {"token": "xyz"},
+        "page_source": "<html>big page</html>",
+        "created_at": now,
+        "updated_at": now,
+    })
+
+    response = await async_client.get(
+        "/api/v1/metadata",
+        params={"url": "https://example.com", "include": "headers,cookies"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["headers"]["server"] == "nginx"
+    assert data["cookies"]["token"] == "xyz"
+    # page_source was projected out and falls back to its default
+    assert data["page_source"] == ""
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_include_unknown_field(async_client, mock_db):
+    """GET with an unknown include field should return 400."""
+    response = await async_client.get(
+        "/api/v1/metadata",
+        params={"url": "https://example.com", "include": "headers,bogus"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_served_from_cache(async_client, mock_db):
+    """A second GET for the same URL should be served from the read cache."""
+    now = datetime.now(timezone.utc)
+    await mock_db.metadata.insert_one({
+        "url": "https://cached.example.com",
+        "headers": {},
+        "cookies": {},
+        "page_source": "<html>hot</html>",
+        "created_at": now,
+        "updated_at": now,
+    })
+
+    first = await async_client.get(
+        "/api/v1/metadata",
+        params={"url": "https://cached.example.com"},
+    )
+    assert first.status_code == 200
+
+    # Remove the record from Mongo — the cached copy should still serve
+    await mock_db.metadata.delete_one({"url": "https://cached.example.com"})
+
+    second = await async_client.get(
+        "/api/v1/metadata",
+        params={"url": "https://cached.example.com"},
+    )
+    assert second.status_code == 200
+    assert second.json()["page_source"] == "<html>hot</html>"
+
+
 @pytest.mark.asyncio
 async def test_get_metadata_invalid_url(async_client):
     """GET with a non-HTTP URL should return 400."""
@@ -0,0 +1,82 @@
+"""
+Tests for the write batcher in the metadata service.
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import metadata_service
+from app.services.metadata_service import (
+    create_metadata_record,
+    start_write_batcher,
+    stop_write_batcher,
+)
+
+# Fake-forward asyncio time so the batcher's debounce window and the
+# shutdown drain don't cost real wall-clock milliseconds.
+pytestmark = pytest.mark.looptime
+
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_concurrent_writes(mock_db, monkeypatch):
+    """Concurrent creates should be flushed through the batcher and persist."""
+    # Plain async stub — no call assertions needed, so skip AsyncMock's
+    # per-call bookkeeping entirely
+    async def fake_collect(url):
+        return {
+            "headers": {"content-type": "text/html"},
+            "cookies": {},
+            "page_source": f"<html>{url}</html>",
+        }
+
+    monkeypatch.setattr(metadata_service, "collect_metadata", fake_collect)
+
+    urls = [f"https://site{i}.example.com" for i in range(5)]
+
+    start_write_batcher()
+    try:
+        await asyncio.gather(*(create_metadata_record(url) for url in urls))
+    finally:
+        await stop_write_batcher()
+
+    for url in urls:
+        doc = await mock_db.metadata.find_one({"url": url})
+        assert doc is not None
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_in_flight_writes(mock_db, monkeypatch):
+    """Writes queued when stop_write_batcher runs must flush, not drop."""
+    async def fake_collect(url):
+        return {"headers": {}, "cookies": {}, "page_source": f"<html>{url}</html>"}
+
+    monkeypatch.setattr(metadata_service, "collect_metadata", fake_collect)
+
+    urls = [f"https://stopping{i}.example.com" for i in range(3)]
+
+    start_write_batcher()
+    creates = [asyncio.create_task(create_metadata_record(url)) for url in urls]
+    # Let the creates reach the queue, then stop while they are in flight
+    await asyncio.sleep(0.01)
+    await stop_write_batcher()
+
+    # Every caller must complete — none may hang on an unresolved future
+    await asyncio.wait_for(asyncio.gather(*creates), timeout=5)
+
+    for url in urls:
+        doc = await mock_db.metadata.find_one({"url": url})
+        assert doc is not None
+
+
+@pytest.mark.asyncio
+async def test_writes_fall_back_when_batcher_not_running(mock_db, monkeypatch):
+    """Without the batcher, create_metadata_record writes directly."""
+    async def fake_collect(url):
+        return {"headers": {}, "cookies": {}, "page_source": "<html/>"}
+
+    monkeypatch.setattr(metadata_service, "collect_metadata", fake_collect)
+    await create_metadata_record("https://direct.example.com")
+
+    doc = await mock_db.metadata.find_one({"url": "https://direct.example.com"})
+    assert doc is not None